@@ -1,6 +1,6 @@
 """Jimaku downloader package."""
 
-from .downloader import JimakuDownloader
+from typing import Any, List
 
 try:
     from jimaku_dl.compat import windows_socket_compat
@@ -13,3 +13,17 @@ except ImportError:
 __version__ = "0.1.6"
 
 __all__ = ["JimakuDownloader"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the downloader lazily so `jimaku-dl -h`/`--version` do not pay for
+    # requests/guessit at startup
+    if name == "JimakuDownloader":
+        from jimaku_dl.downloader import JimakuDownloader
+
+        return JimakuDownloader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
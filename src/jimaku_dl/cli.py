@@ -1,59 +1,94 @@
 #!/usr/bin/env python3
 import argparse
+import errno
+import functools
 import json
 import logging
 import socket
 import sys
 import threading
 import time
-from os import environ, path
+from collections import deque
+from os import environ, execvp, path
+from subprocess import DEVNULL, PIPE, Popen
 from subprocess import run as subprocess_run
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from jimaku_dl import __version__
-from jimaku_dl.downloader import FFSUBSYNC_AVAILABLE, JimakuDownloader
+from jimaku_dl.compat import is_windows
 
+if TYPE_CHECKING:
+    from jimaku_dl.downloader import JimakuDownloader
 
-def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VERSION_STRING = f"jimaku-dl {__version__}"
+
+
+def _mpv_command(*command: Any, request_id: Optional[int] = None) -> bytes:
+    """Serialize an MPV JSON IPC command as one newline-terminated line."""
+    message: Dict[str, Any] = {"command": list(command)}
+    if request_id is not None:
+        message["request_id"] = request_id
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+# Commands that never change are serialized once at import time
+_MPV_SUB_RELOAD = _mpv_command("sub-reload", request_id=1)
+_MPV_TRACK_LIST = _mpv_command("get_property", "track-list", request_id=100)
+_MPV_SUB_VISIBLE = _mpv_command("set_property", "sub-visibility", "yes", request_id=3)
+_MPV_SYNC_DONE = _mpv_command(
+    "osd-msg", "Subtitle synchronization complete!", request_id=5
+) + _mpv_command(
+    "show-text", "Subtitle synchronization complete!", 3000, 1, request_id=6
+)
+_MPV_IGNORE = _mpv_command("ignore")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command line arguments for jimaku-dl.
+    Build the jimaku-dl argument parser.
 
-    Parameters
-    ----------
-    args : sequence of str, optional
-        Command line argument strings. If None, sys.argv[1:] is used.
+    The parser holds no per-call state, so it is built once and reused by
+    every call to parse_args.
 
     Returns
     -------
-    argparse.Namespace
-        Object containing argument values as attributes
+    argparse.ArgumentParser
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description="Download and manage anime subtitles from Jimaku"
     )
 
     # Add version argument
-    parser.add_argument(
-        "-v", "--version", action="version", version=f"jimaku-dl {__version__}"
-    )
+    parser.add_argument("-v", "--version", action="version", version=_VERSION_STRING)
 
     # Global options
     parser.add_argument(
         "-t",
         "--token",
+        "--api-token",
+        dest="token",
         help="Jimaku API token (can also use JIMAKU_API_TOKEN env var)",
     )
     parser.add_argument(
         "-l",
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVELS,
         default="INFO",
         help="Set logging level",
     )
 
     # Main functionality options
     parser.add_argument("media_path", help="Path to media file or directory")
-    parser.add_argument("-d", "--dest-dir", help="Destination directory for subtitles")
+    parser.add_argument(
+        "-d",
+        "--dest-dir",
+        "--dest",
+        dest="dest_dir",
+        help="Destination directory for subtitles",
+    )
     parser.add_argument(
         "-p", "--play", action="store_true", help="Play media with MPV after download"
     )
@@ -71,7 +106,133 @@ def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="Rename subtitle files with .ja extension to match video filename",
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments for jimaku-dl.
+
+    Parameters
+    ----------
+    args : sequence of str, optional
+        Command line argument strings. If None, sys.argv[1:] is used.
+
+    Returns
+    -------
+    argparse.Namespace
+        Object containing argument values as attributes
+    """
+    # Answer --version before building the parser; nothing else is needed for it
+    argv = sys.argv[1:] if args is None else list(args)
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg in ("-v", "--version"):
+            print(_VERSION_STRING)
+            sys.exit(0)
+
+    return _build_parser().parse_args(argv)
+
+
+def connect_socket(socket_path: str, max_wait: float = 0.2) -> socket.socket:
+    """
+    Connect to MPV's IPC socket, retrying while MPV starts listening.
+
+    MPV creates the socket file just before it calls listen(), so an early
+    connect can be refused. Retries use a non-blocking connect with a short
+    exponential backoff instead of a fixed sleep.
+
+    Parameters
+    ----------
+    socket_path : str
+        Path to MPV's IPC socket
+    max_wait : float, default=0.2
+        Maximum number of seconds to keep retrying
+
+    Returns
+    -------
+    socket.socket
+        Connected socket in blocking mode
+
+    Raises
+    ------
+    OSError
+        If the connection could not be established in time
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    waited = 0.0
+    attempt = 0
+    while True:
+        err = sock.connect_ex(socket_path)
+        if err in (0, errno.EISCONN):
+            break
+        if waited >= max_wait:
+            sock.close()
+            raise OSError(err, f"Could not connect to {socket_path}")
+        delay = min(0.005 * 2**attempt, max_wait - waited)
+        time.sleep(delay)
+        waited += delay
+        attempt += 1
+    sock.setblocking(True)
+    return sock
+
+
+_sync_logger_lock = threading.Lock()
+
+
+def _get_sync_logger() -> logging.Logger:
+    """
+    Return the background sync logger, attaching its file handler only once.
+
+    Returns
+    -------
+    logging.Logger
+        Logger writing to ~/.jimaku-sync.log
+    """
+    logger = logging.getLogger("jimaku_sync")
+    with _sync_logger_lock:
+        if not any(isinstance(h, logging.FileHandler) for h in logger.handlers):
+            handler = logging.FileHandler(path.expanduser("~/.jimaku-sync.log"))
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+    return logger
+
+
+def wait_for_socket(socket_path: str, max_wait: float = 10) -> bool:
+    """
+    Wait for MPV to create its IPC socket file.
+
+    Polls with an exponential backoff (10ms, 20ms, 40ms... capped at 0.5s)
+    so a socket that appears quickly is picked up almost immediately.
+
+    Parameters
+    ----------
+    socket_path : str
+        Path to MPV's IPC socket
+    max_wait : float, default=10
+        Maximum number of seconds to wait
+
+    Returns
+    -------
+    bool
+        True if the socket exists, False if it did not appear in time
+    """
+    _exists, _sleep, _monotonic = path.exists, time.sleep, time.monotonic
+    deadline = _monotonic() + max_wait
+    attempt = 0
+    while not _exists(socket_path):
+        remaining = deadline - _monotonic()
+        if remaining <= 0:
+            return False
+        _sleep(min(0.5, 0.01 * 2**attempt, remaining))
+        attempt += 1
+    return True
 
 
 def sync_subtitles_thread(
@@ -83,130 +244,100 @@ def sync_subtitles_thread(
     This function runs in a background thread to synchronize subtitles and then
     update the MPV player through its socket interface.
     """
-    logger = logging.getLogger("jimaku_sync")
-    handler = logging.FileHandler(path.expanduser("~/.jimaku-sync.log"))
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger = _get_sync_logger()
 
     try:
         logger.info(f"Starting sync: {video_path} -> {output_path}")
 
-        # Run ffsubsync directly through subprocess
-        result = subprocess_run(
+        # Run ffsubsync directly, keeping only the tail of its progress output
+        with Popen(
             ["ffsubsync", video_path, "-i", subtitle_path, "-o", output_path],
-            capture_output=True,
+            stdout=DEVNULL,
+            stderr=PIPE,
             text=True,
-        )
-
-        if result.returncode != 0 or not path.exists(output_path):
-            logger.error(f"Synchronization failed: {result.stderr}")
-            print(f"Sync failed: {result.stderr}")
+        ) as proc:
+            assert proc.stderr is not None  # stderr=PIPE
+            stderr_tail = deque(proc.stderr, maxlen=200)
+            returncode = proc.wait()
+
+        if returncode != 0 or not path.exists(output_path):
+            stderr = "".join(stderr_tail)
+            logger.error(f"Synchronization failed: {stderr}")
+            print(f"Sync failed: {stderr}")
             return
 
         print("Synchronization successful!")
         logger.info(f"Sync successful: {output_path}")
 
-        start_time = time.time()
-        max_wait = 10
-
-        while not path.exists(socket_path) and time.time() - start_time < max_wait:
-            time.sleep(0.5)
-
-        if not path.exists(socket_path):
+        if not wait_for_socket(socket_path, max_wait=10):
             logger.error(f"Socket not found after waiting: {socket_path}")
             return
 
         try:
-            time.sleep(0.5)  # Give MPV a moment to initialize the socket
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock = connect_socket(socket_path)
             sock.settimeout(0.5)  # Short timeout for reads
-            sock.connect(socket_path)
+            # MPV replies with one JSON object per line, interleaved with events
+            reader = sock.makefile("rb")
 
-            def send_command(cmd):
+            def send_commands(cmds: List[bytes]) -> bool:
                 try:
-                    sock.send(json.dumps(cmd).encode("utf-8") + b"\n")
-                    try:
-                        response = sock.recv(1024)
-                        logger.debug(
-                            f"MPV response: {response.decode('utf-8', errors='ignore')}"
-                        )
-                    except socket.timeout:
-                        pass
-                    time.sleep(0.1)
+                    sock.sendall(b"".join(cmds))
                 except Exception as e:
                     logger.debug(f"Socket send error: {e}")
                     return False
                 return True
 
+            def read_response(request_id: int) -> Optional[Dict[str, Any]]:
+                """Read MPV replies until the one tagged with ``request_id``."""
+                try:
+                    for line in reader:
+                        logger.debug(
+                            f"MPV response: {line.decode('utf-8', errors='ignore')}"
+                        )
+                        try:
+                            reply: Dict[str, Any] = json.loads(line)
+                        except ValueError:
+                            continue
+                        if reply.get("request_id") == request_id:
+                            return reply
+                except socket.timeout:
+                    pass
+                return None
+
             # Helper function to get highest subtitle track ID
             def get_current_subtitle_count():
                 try:
-                    sock.send(
-                        json.dumps(
-                            {
-                                "command": ["get_property", "track-list"],
-                                "request_id": 100,
-                            }
-                        ).encode("utf-8")
-                        + b"\n"
-                    )
-                    response = sock.recv(4096).decode("utf-8")
-                    track_list = json.loads(response)["data"]
+                    reply = read_response(100)
+                    track_list = reply["data"]
                     sub_tracks = [t for t in track_list if t.get("type") == "sub"]
                     return len(sub_tracks)
                 except Exception as e:
                     logger.debug(f"Error getting track count: {e}")
                     return 0
 
+            # MPV executes queued commands in order, so the track-list query
+            # can ride along with the reload and sees the newly added track
             commands = [
-                {"command": ["sub-reload"], "request_id": 1},
-                {"command": ["sub-add", output_path], "request_id": 2},
+                _MPV_SUB_RELOAD,
+                _mpv_command("sub-add", output_path, request_id=2),
+                _MPV_TRACK_LIST,
             ]
 
-            all_succeeded = True
-            for cmd in commands:
-                if not send_command(cmd):
-                    all_succeeded = False
-                    break
+            all_succeeded = send_commands(commands)
+            final_commands = []
 
             if all_succeeded:
                 new_sid = get_current_subtitle_count()
                 if new_sid > 0:
                     final_commands = [
-                        {
-                            "command": ["set_property", "sub-visibility", "yes"],
-                            "request_id": 3,
-                        },
-                        {"command": ["set_property", "sid", new_sid], "request_id": 4},
-                        {
-                            "command": [
-                                "osd-msg",
-                                "Subtitle synchronization complete!",
-                            ],
-                            "request_id": 5,
-                        },
-                        {
-                            "command": [
-                                "show-text",
-                                "Subtitle synchronization complete!",
-                                3000,
-                                1,
-                            ],
-                            "request_id": 6,
-                        },
+                        _MPV_SUB_VISIBLE,
+                        _mpv_command("set_property", "sid", new_sid, request_id=4),
+                        _MPV_SYNC_DONE,
                     ]
-                    for cmd in final_commands:
-                        if not send_command(cmd):
-                            all_succeeded = False
-                            break
-                        time.sleep(0.1)  # Small delay between commands
 
             try:
-                send_command({"command": ["ignore"]})
+                if not send_commands(final_commands + [_MPV_IGNORE]):
+                    all_succeeded = False
                 sock.shutdown(socket.SHUT_WR)
                 while True:
                     try:
@@ -219,6 +350,7 @@ def sync_subtitles_thread(
             except Exception as e:
                 logger.debug(f"Socket shutdown error: {e}")
             finally:
+                reader.close()
                 sock.close()
 
             if all_succeeded:
@@ -262,10 +394,45 @@ def run_background_sync(
         logger.error(f"Failed to start sync thread: {e}")
 
 
+@functools.lru_cache(maxsize=4)
+def _get_downloader(
+    api_token: str, log_level: str, rename_with_ja_ext: bool
+) -> "JimakuDownloader":
+    """
+    Return a JimakuDownloader, reusing one built with the same settings.
+
+    Parameters
+    ----------
+    api_token : str
+        Jimaku API token
+    log_level : str
+        Logging level
+    rename_with_ja_ext : bool
+        Whether to rename downloaded subtitles to match video name
+
+    Returns
+    -------
+    JimakuDownloader
+        Downloader configured with the given settings
+    """
+    from jimaku_dl.downloader import JimakuDownloader
+
+    return JimakuDownloader(
+        api_token=api_token,
+        log_level=log_level,
+        rename_with_ja_ext=rename_with_ja_ext,
+    )
+
+
 def main(args: Optional[Sequence[str]] = None) -> int:
     """
     Main entry point for the jimaku-dl command line tool.
 
+    When playing a single file without --sync on a non-Windows platform,
+    the current process is replaced by MPV via os.execvp, so this function
+    does not return and the process exits with MPV's exit status. This also
+    applies when main() is called from Python.
+
     Parameters
     ----------
     args : sequence of str, optional
@@ -274,7 +441,8 @@ def main(args: Optional[Sequence[str]] = None) -> int:
     Returns
     -------
     int
-        Exit code (0 for success, non-zero for errors)
+        Exit code (0 for success, non-zero for errors); not returned when
+        MPV takes over the process
     """
     try:
         parsed_args = parse_args(args)
@@ -282,15 +450,9 @@ def main(args: Optional[Sequence[str]] = None) -> int:
         return e.code
 
     # Get API token from args or environment
-    api_token = parsed_args.token if hasattr(parsed_args, "token") else None
-    if not api_token:
-        api_token = environ.get("JIMAKU_API_TOKEN", "")
+    api_token = parsed_args.token or environ.get("JIMAKU_API_TOKEN", "")
 
-    downloader = JimakuDownloader(
-        api_token=api_token,
-        log_level=parsed_args.log_level,
-        rename_with_ja_ext=parsed_args.rename,
-    )
+    downloader = _get_downloader(api_token, parsed_args.log_level, parsed_args.rename)
 
     try:
         if not path.exists(parsed_args.media_path):
@@ -298,12 +460,18 @@ def main(args: Optional[Sequence[str]] = None) -> int:
             return 1
 
         sync_enabled = parsed_args.sync
-        if sync_enabled and not FFSUBSYNC_AVAILABLE:
-            print(
-                "Warning: ffsubsync is not installed. Synchronization will be skipped."
-            )
-            print("Install it with: pip install ffsubsync")
-            sync_enabled = False
+        if sync_enabled:
+            # Loaded by _get_downloader above; find_spec-based, so ffsubsync
+            # itself is never imported here
+            from jimaku_dl.downloader import FFSUBSYNC_AVAILABLE
+
+            if not FFSUBSYNC_AVAILABLE:
+                print(
+                    "Warning: ffsubsync is not installed. "
+                    "Synchronization will be skipped."
+                )
+                print("Install it with: pip install ffsubsync")
+                sync_enabled = False
 
         is_directory = path.isdir(parsed_args.media_path)
         downloaded_files = downloader.download_subtitles(
@@ -324,14 +492,10 @@ def main(args: Optional[Sequence[str]] = None) -> int:
 
             socket_path = "/tmp/mpvsocket"
 
-            if parsed_args.sync:
+            if sync_enabled:
                 base, ext = path.splitext(subtitle_file)
                 output_path = f"{base}.synced{ext}"
-
-                if FFSUBSYNC_AVAILABLE:
-                    run_background_sync(
-                        media_file, subtitle_file, output_path, socket_path
-                    )
+                run_background_sync(media_file, subtitle_file, output_path, socket_path)
 
             sid, aid = downloader.get_track_ids(media_file, subtitle_file)
 
@@ -348,7 +512,15 @@ def main(args: Optional[Sequence[str]] = None) -> int:
                 mpv_cmd.append(f"--aid={aid}")
 
             try:
-                subprocess_run(mpv_cmd)
+                if sync_enabled or is_windows():
+                    # The sync thread has to outlive MPV's startup
+                    subprocess_run(mpv_cmd)
+                else:
+                    # Nothing is left to do after playback, so let MPV take over
+                    # this process instead of keeping the interpreter resident
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    execvp("mpv", mpv_cmd)
             except FileNotFoundError:
                 print("Warning: MPV not found. Could not play video.")
                 return 1
@@ -1177,22 +1177,33 @@ class JimakuDownloader:
         bool
             True if command was sent successfully, False otherwise
         """
+        sock = None
+        reader = None
         try:
             time.sleep(1)
             sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             sock.settimeout(3.0)  # Add timeout to avoid hanging
             sock.connect(socket_path)
+            # MPV replies with one JSON object per line, interleaved with events
+            reader = sock.makefile("rb")
 
             def send_command(cmd):
-                """Helper function to send command and read response"""
+                """Helper function to send command and read its response"""
                 try:
-                    sock.send(json.dumps(cmd).encode("utf-8") + b"\n")
-                    try:
-                        response = sock.recv(4096).decode("utf-8")
-                        self.logger.debug(f"MPV response: {response}")
-                        return json.loads(response)
-                    except (socket.timeout, json.JSONDecodeError):
-                        return None
+                    sock.sendall(json.dumps(cmd).encode("utf-8") + b"\n")
+                    for line in reader:
+                        self.logger.debug(
+                            "MPV response: %s", line.decode("utf-8", errors="replace")
+                        )
+                        try:
+                            response = json.loads(line)
+                        except ValueError:
+                            continue
+                        if response.get("request_id") == cmd.get("request_id"):
+                            return response
+                    return None
+                except socket.timeout:
+                    return None
                 except Exception as e:
                     self.logger.debug(f"Socket send error: {e}")
                     return None
@@ -1234,12 +1245,8 @@ class JimakuDownloader:
                     if not send_command(cmd):
                         all_succeeded = False
                         break
-                    time.sleep(0.1)
 
-                try:
-                    sock.shutdown(socket.SHUT_RDWR)
-                finally:
-                    sock.close()
+                sock.shutdown(socket.SHUT_RDWR)
 
                 if all_succeeded:
                     self.logger.info(
@@ -1252,6 +1259,11 @@ class JimakuDownloader:
         except Exception as e:
             self.logger.error(f"Failed to update MPV subtitles: {e}")
             return False
+        finally:
+            if reader is not None:
+                reader.close()
+            if sock is not None:
+                sock.close()
 
     def download_subtitles(
         self,